@@ -16,6 +16,7 @@ VERSION_STR = locals_dict['VERSION_STR']
 
 import io
 from pathlib import Path
+from functools import lru_cache
 import pkg_resources
 
 from bthci import HCI, ControllerErrorCodes
@@ -23,6 +24,7 @@ from bthci import HCI, ControllerErrorCodes
 
 PKG_ROOT = Path(__file__).parent
 MICRO_BIT_FIRMWARE_PATH = PKG_ROOT/'res'/'micro-bit.hex'
+BLUETOOTHD_STORAGE_DIR = '/var/lib/bluetooth'
 
 # https://www.bluetooth.com/specifications/assigned-numbers/service-discovery/
 #     Table 2: Service Class Profile Identifiers
@@ -59,20 +61,33 @@ for line in service_cls_profile_ids_file:
     }
 
 
+@lru_cache(maxsize=None)
+def read_local_bd_addr(iface: str = 'hci0') -> str:
+    """Read the BD_ADDR of a local HCI device.
+    
+    The result is cached per HCI device, so the controller is only asked once
+    per process.
+    """
+    hci = HCI(iface)
+    cmd_complete = hci.read_bd_addr()
+    hci.close()
+
+    if cmd_complete.status != ControllerErrorCodes.SUCCESS:
+        raise RuntimeError("hci.read_bd_addr() returned, status: 0x{:02x} - {}".format(
+            cmd_complete.status, cmd_complete.status.name))
+    
+    return cmd_complete.bd_addr.upper()
+
+
 class BlueScanner():
     def __init__(self, iface='hci0'):
         self.iface = iface
         self.devid = HCI.hcistr2devid(self.iface)
-        
-        hci = HCI(iface)
-        cmd_complete = hci.read_bd_addr()
-        hci.close()
-
-        if cmd_complete.status != ControllerErrorCodes.SUCCESS:
-            raise RuntimeError("hci.read_bd_addr() returned, status: 0x{:02x} - {}".format(
-                cmd_complete.status, cmd_complete.status.name))
-        else:
-            self.hci_bd_addr = cmd_complete.bd_addr.upper()
+
+    @property
+    def hci_bd_addr(self) -> str:
+        """BD_ADDR of the local HCI device, read from the controller on first use."""
+        return read_local_bd_addr(self.iface)
 
 
 class ScanResult:  
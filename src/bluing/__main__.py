@@ -3,60 +3,53 @@
 import os
 import sys
 from shutil import copy
+from importlib import import_module
 from subprocess import STDOUT, check_output
 from pathlib import Path
 
 from xpycommon.log import Logger
 from xpycommon.ui import red, blue
-from xpycommon.bluetooth.bluez import stop_bluetooth_service, \
-    restart_bluetooth_service
 
-from bthci import HCI
-
-from . import LOG_LEVEL, MICRO_BIT_FIRMWARE_PATH
+from . import PKG_NAME, LOG_LEVEL, MICRO_BIT_FIRMWARE_PATH, BLUETOOTHD_STORAGE_DIR, \
+    read_local_bd_addr
 from .ui import parse_cmdline
-from .br import main as br_main
-from .le import main as le_main
-from .android import main as android_main
-from .spoof import main as spoof_main
-from .plugin import main as plugin_main
 
 
 logger = Logger(__name__, LOG_LEVEL)
-cmd_to_main = {
-    'br': br_main,
-    'le': le_main,
-    'android': android_main,
-    'spoof': spoof_main,
-    'plugin': plugin_main,
+
+# Commands are dispatched to their subpackages, which are only imported when 
+# the command is actually run.
+cmd_to_pkg = {
+    'br': '.'.join([PKG_NAME, 'br']),
+    'le': '.'.join([PKG_NAME, 'le']),
+    'android': '.'.join([PKG_NAME, 'android']),
+    'spoof': '.'.join([PKG_NAME, 'spoof']),
+    'plugin': '.'.join([PKG_NAME, 'plugin']),
 }
 
 
 def clean(iface: str, raddr: str):
-    hci = HCI(iface)
-    laddr = hci.bd_addr
-    hci.close()
-    
+    laddr = read_local_bd_addr(iface)
     raddr = raddr.upper()
 
-    stop_bluetooth_service()
+    dev_path = os.path.join(BLUETOOTHD_STORAGE_DIR, laddr, raddr)
+    cache_path = os.path.join(BLUETOOTHD_STORAGE_DIR, laddr, 'cache', raddr)
 
+    # Stop bluetoothd, drop the cached data and start it again in one shell, 
+    # instead of spawning a process for each step. bluetoothd is left alone 
+    # when there is nothing to drop.
     output = check_output(
-        ' '.join(['sudo', 'rm', '-rf', '/var/lib/bluetooth/' + \
-                  laddr + '/' + raddr]), 
-        stderr=STDOUT, timeout=60, shell=True)
+        ['sudo', 'sh', '-c', 
+         '[ -e {0} ] || [ -e {1} ] || {{ echo "No cached data of {2}"; exit 0; }}; '.format(
+             dev_path, cache_path, raddr) + \
+         ' && '.join([
+            'systemctl stop bluetooth.service',
+            ' '.join(['rm', '-rf', dev_path, cache_path]),
+            'systemctl start bluetooth.service'])], 
+        stderr=STDOUT, timeout=60)
     if output != b'':
         logger.info(output.decode())
 
-    output = check_output(
-        ' '.join(['sudo', 'rm', '-rf', '/var/lib/bluetooth/' + \
-                  laddr + '/' + 'cache' + '/' + raddr]), 
-        stderr=STDOUT, timeout=60, shell=True)
-    if output != b'':
-        logger.info(output.decode())
-
-    restart_bluetooth_service()
-
 
 def flash_micro_bit():
     user_name = os.environ['USER']
@@ -93,7 +86,6 @@ def main(argv: list[str] = sys.argv):
                 # TODO
                 # * When there is no HCI device in the system, clean 
                 #   cahces based on the BD_ADDR provided by users.
-                # * Prompt the user when the directory does not exist.
                 clean(args['-i'], args['BD_ADDR'])
             elif args['--flash-micro-bit']:
                 flash_micro_bit()
@@ -104,9 +96,11 @@ def main(argv: list[str] = sys.argv):
             argv = [cmd] + args['<args>']
 
             try:
-                cmd_to_main[cmd](argv)
+                pkg_name = cmd_to_pkg[cmd]
             except KeyError as e:
                 raise ValueError("Invalid command: " + red(args['<command>']))
+
+            import_module(pkg_name).main(argv)
     except Exception as e:
         logger.error("{}: \"{}\"".format(e.__class__.__name__, e))
         sys.exit(1)
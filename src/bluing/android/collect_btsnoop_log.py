@@ -16,9 +16,9 @@ def collect_btsnoop_log(transport_id: int | None = None, output_file: str = './b
     btsnooz_py = PKG_ROOT/'btsnooz.py'
 
     try:
-        subprocess.check_output('adb {} shell dumpsys bluetooth_manager > {}'.format(
+        subprocess.run('adb {} shell dumpsys bluetooth_manager > {}'.format(
             '' if transport_id is None else '-t {}'.format(transport_id), 
-            bluetooth_manager_bug_report), shell=True)
+            bluetooth_manager_bug_report), shell=True, check=True)
     except CalledProcessError as e:
         raise RuntimeError('adb failed')
 
@@ -33,8 +33,9 @@ def collect_btsnoop_log(transport_id: int | None = None, output_file: str = './b
             logger.error("{}: \"{}\"".format(e.__class__.__name__, str(e)))
             raise RuntimeError('btsnooz failed')
 
-    if os.path.exists(bluetooth_manager_bug_report):
-        try:
-            subprocess.check_output('rm -f {}'.format(bluetooth_manager_bug_report), shell=True)
-        except CalledProcessError as e:
-            logger.warning("{}: {}".format(e.__class__.__name__, str(e)))
+    try:
+        os.remove(bluetooth_manager_bug_report)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("{}: {}".format(e.__class__.__name__, str(e)))
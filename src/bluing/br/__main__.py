@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 
 import sys
-from subprocess import CalledProcessError, check_output, STDOUT
+from subprocess import CalledProcessError, DEVNULL, run
 from traceback import format_exception
 
 from xpycommon.log import Logger
@@ -14,51 +14,66 @@ from bthci.events import HCI_Connection_Request
 
 from . import LOG_LEVEL
 from .ui import parse_cmdline
-from .br_scan import BrScanner
-from .sdp_scan import SdpScanner
 
 
 logger = Logger(__name__, LOG_LEVEL)
 
 
+def check_cmd_complete(cmd_complete, action: str) -> bool:
+    """Warn if the HCI command failed, return whether it succeeded."""
+    if cmd_complete.status != ControllerErrorCodes.SUCCESS:
+        logger.warning("Failed to {}\n"
+                       "    command complete status: 0x{:02x} - {} ".format(
+                           action, cmd_complete.status, cmd_complete.status.name))
+        return False
+    
+    return True
+
+
 def main(argv: list[str] = sys.argv):
     args = parse_cmdline(argv[1:])
     logger.debug("parse_cmdline() returned\n"
                  "    args:", args)
 
+    # Whether an HCI device has been driven, and may need to be reset on 
+    # interruption.
+    hci_used = False
+
     try:
+        # Scanners are imported on demand, as they pull in heavy dependencies 
+        # that most options never use.
         if args['--inquiry']:
+            from .br_scan import BrScanner
+            hci_used = True
             br_scanner = BrScanner(args['-i'])
             br_scanner.inquiry(inquiry_len=args['--inquiry-len'])
         elif args['--sdp']:
+            from .sdp_scan import SdpScanner
+            hci_used = True
             SdpScanner(args['-i']).scan(args['BD_ADDR'])
         elif args['--lmp-features']:
             if args['--local']: # Move to BrScanenr
                 # HCI Read Local Supported Features 
                 raise NotImplementedError("The `--local` option is not yet implemented")
             else:
+                from .br_scan import BrScanner
+                hci_used = True
                 br_scanner = BrScanner(args['-i'])
                 br_scanner.scan_lmp_features(args['BD_ADDR'])
         elif args['--stack']:
             # StackScanner(args['-i']).scan(args['BD_ADDR'])
             raise NotImplementedError("The `--stack` option is not yet implemented")
         elif args['--mon-incoming-conn']:
+            hci_used = True
             hci = HCI(args['-i'])
 
             cmd_complete = hci.write_inquiry_scan_activity(
                 HCI_Write_Inquiry_Scan_Activity.inquiry_scan_interval_max, 
                 HCI_Write_Inquiry_Scan_Activity.inquiry_scan_window_max)
-            if cmd_complete.status != ControllerErrorCodes.SUCCESS:
-                logger.warning("Failed to write inquiry scan activity\n"
-                            "    command complete status: 0x{:02x} - {} ".format(
-                                cmd_complete.status, cmd_complete.status.name))
+            check_cmd_complete(cmd_complete, "write inquiry scan activity")
             
             cmd_complete = hci.read_inquiry_scan_activity()
-            if cmd_complete.status != ControllerErrorCodes.SUCCESS:
-                logger.warning("Failed to read inquiry scan activity\n"
-                            "    command complete status: 0x{:02x} - {} ".format(
-                                cmd_complete.status, cmd_complete.status.name))
-            else:
+            if check_cmd_complete(cmd_complete, "read inquiry scan activity"):
                 logger.info("Inquiry_Scan_Interval: {}, {} ms\n"
                             "Inquiry_Scan_Window:   {}, {} ms".format(cmd_complete.inquiry_scan_interval, cmd_complete.inquiry_scan_interval * 0.625,
                                                                     cmd_complete.inquiry_scan_window, cmd_complete.inquiry_scan_window * 0.625))
@@ -72,17 +87,10 @@ def main(argv: list[str] = sys.argv):
                 scan_enable = ScanEnableValues.piscan
 
             cmd_complete = hci.write_scan_enable(scan_enable)
-            if cmd_complete.status != ControllerErrorCodes.SUCCESS:
-                logger.warning("Failed to enable inquiry/page scan\n"
-                            "    command complete status: 0x{:02x} - {} ".format(
-                                cmd_complete.status, cmd_complete.status.name))
+            check_cmd_complete(cmd_complete, "enable inquiry/page scan")
             
             cmd_complete = hci.read_scan_enable()
-            if cmd_complete.status != ControllerErrorCodes.SUCCESS:
-                logger.warning("Failed to read scan enable\n"
-                            "    command complete status: 0x{:02x} - {} ".format(
-                                cmd_complete.status, cmd_complete.status.name))
-            else:
+            if check_cmd_complete(cmd_complete, "read scan enable"):
                 logger.info(cmd_complete.scan_enable.desc)
                 print()
 
@@ -103,18 +111,18 @@ def main(argv: list[str] = sys.argv):
             raise ValueError("Invalid option(s)")
     except TimeoutError as e:
         logger.error("Timeout")
-        if args != None and args['-i'] != None:
+        if hci_used:
             try:
-                output = check_output(' '.join(['hciconfig', args['-i'], 'reset']), 
-                                                 stderr=STDOUT, timeout=60, shell=True)
-            except CalledProcessError as e:
+                run(['hciconfig', args['-i'], 'reset'], stdout=DEVNULL, 
+                    stderr=DEVNULL, timeout=60, check=True)
+            except (CalledProcessError, OSError) as e:
                 logger.warning("{}: {}".format(e.__class__.__name__, e))
     except KeyboardInterrupt:
-        if args != None and args['-i'] != None:
+        if hci_used:
             try:
-                output = check_output(' '.join(['hciconfig', args['-i'], 'reset']), 
-                                                 stderr=STDOUT, timeout=60, shell=True)
-            except CalledProcessError as e:
+                run(['hciconfig', args['-i'], 'reset'], stdout=DEVNULL, 
+                    stderr=DEVNULL, timeout=60, check=True)
+            except (CalledProcessError, OSError) as e:
                 logger.warning("{}: {}".format(e.__class__.__name__, e))
         print()
         logger.info("Canceled\n")
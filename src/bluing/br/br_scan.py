@@ -110,9 +110,9 @@ class BrScanner(BlueScanner):
 
         read_remote_supported_features_complete = hci.read_remote_supported_features(conn_complete.conn_handle)
         if read_remote_supported_features_complete.status != ControllerErrorCodes.SUCCESS:
-            logger.error("Failed to read remote extented features\n"
-                         "    read remote extented features complete status: 0x{:02x} - {}".format(
-                             read_remote_ext_features_complete.status, ControllerErrorCodes[read_remote_ext_features_complete.status].name))
+            logger.error("Failed to read remote supported features\n"
+                         "    read remote supported features complete status: 0x{:02x} - {}".format(
+                             read_remote_supported_features_complete.status, ControllerErrorCodes[read_remote_supported_features_complete.status].name))
             hci.disconnect(conn_complete.conn_handle)
             sys.exit(1)
   
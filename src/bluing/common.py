@@ -2,6 +2,7 @@
 
 import io
 import pkg_resources
+from functools import lru_cache
 
 from dbus.exceptions import DBusException
 
@@ -13,16 +14,22 @@ from . import LOG_LEVEL
 
 logger = Logger(__name__, LOG_LEVEL)
 
-oui_file = pkg_resources.resource_stream(__name__, "res/oui.txt")
-oui_file = io.TextIOWrapper(oui_file)
-oui_company_names = {}
-for line in oui_file:
-    items = line.strip().split('\t\t')
-    if len(items) == 2 and '   (hex)' in items[0]:
-        company_id = items[0].removesuffix('   (hex)')
-        oui_company_names[company_id] = items[1]
-        
-# logger.debug("oui_company_names: {}".format(oui_company_names))
+
+@lru_cache(maxsize=None)
+def load_oui_company_names() -> dict:
+    """Parse res/oui.txt on first use and keep the result for later lookups."""
+    oui_file = pkg_resources.resource_stream(__name__, "res/oui.txt")
+    oui_file = io.TextIOWrapper(oui_file)
+    oui_company_names = {}
+    for line in oui_file:
+        items = line.strip().split('\t\t')
+        if len(items) == 2 and '   (hex)' in items[0]:
+            company_id = items[0].removesuffix('   (hex)')
+            oui_company_names[company_id] = items[1]
+    oui_file.close()
+            
+    # logger.debug("oui_company_names: {}".format(oui_company_names))
+    return oui_company_names
 
 
 class InvalidArgsException(DBusException):
@@ -51,6 +58,6 @@ def bdaddr_to_company_name(addr: str):
     logger.debug(company_id)
 
     try:
-        return blue(oui_company_names[company_id])
+        return blue(load_oui_company_names()[company_id])
     except KeyError:
         return red('Unknown')
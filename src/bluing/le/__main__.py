@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 
 import sys
-from subprocess import CalledProcessError, check_output, STDOUT
+from subprocess import CalledProcessError, DEVNULL, run
 from traceback import format_exception
 
 from xpycommon.log import Logger
@@ -9,11 +9,8 @@ from xpycommon.ui import blue
 
 from bluepy.btle import BTLEException
 
-from .microbit import get_microbit_devpaths
 from . import LOG_LEVEL
 from .ui import parse_cmdline
-from .le_scan import LeScanner
-from .gatt_scan import GattScanner
 
 
 logger = Logger(__name__, LOG_LEVEL)
@@ -24,22 +21,39 @@ def main(argv: list[str] = sys.argv):
     logger.debug("parse_cmdline() returned\n"
                  "    args:", args)
 
+    # Whether an HCI device has been driven, and may need to be reset on 
+    # interruption.
+    hci_used = False
+
     try:
         scan_result = None
 
+        # Scanners are imported on demand, as they pull in heavy dependencies 
+        # that most options never use.
         if args['--scan']:
+            from .le_scan import LeScanner
+            hci_used = True
             scan_result = LeScanner(args['-i']).scan_devs(args['--timeout'], 
                     args['--scan-type'], args['--sort'])
         elif args['--ll-feature-set']:
+            from .le_scan import LeScanner
+            hci_used = True
             LeScanner(args['-i']).read_ll_feature_set(
                 args['PEER_ADDR'], args['--addr-type'], args['--timeout'])
         elif args['--pairing-feature']:
+            from .le_scan import LeScanner
+            hci_used = True
             LeScanner(args['-i']).req_pairing_feature(
                 args['PEER_ADDR'], args['--addr-type'], args['--timeout'])
         elif args['--gatt']:
-            scan_result = GattScanner(args['-i'], args['--io-cap']).scan(
+            from .gatt_scan import GattScanner
+            hci_used = True
+            scan_result = GattScanner(args['-i'], args['--io-cap'], 
+                                      args['--keep-cache']).scan(
                 args['PEER_ADDR'], args['--addr-type']) 
         elif args['--sniff-adv']:
+            from .microbit import get_microbit_devpaths
+            from .le_scan import LeScanner
             if not args['--device']:
                 dev_paths = get_microbit_devpaths()
             else:
@@ -73,18 +87,18 @@ def main(argv: list[str] = sys.argv):
         sys.exit(1)
     except TimeoutError as e:
         logger.error("Timeout")
-        if args != None and args['-i'] != None:
+        if hci_used:
             try:
-                output = check_output(' '.join(['hciconfig', args['-i'], 'reset']), 
-                                                 stderr=STDOUT, timeout=60, shell=True)
-            except CalledProcessError as e:
+                run(['hciconfig', args['-i'], 'reset'], stdout=DEVNULL, 
+                    stderr=DEVNULL, timeout=60, check=True)
+            except (CalledProcessError, OSError) as e:
                 logger.warning("{}: {}".format(e.__class__.__name__, e))
     except KeyboardInterrupt:
-        if args != None and args['-i'] != None:
+        if hci_used:
             try:
-                output = check_output(' '.join(['hciconfig', args['-i'], 'reset']), 
-                                                 stderr=STDOUT, timeout=60, shell=True)
-            except CalledProcessError as e:
+                run(['hciconfig', args['-i'], 'reset'], stdout=DEVNULL, 
+                    stderr=DEVNULL, timeout=60, check=True)
+            except (CalledProcessError, OSError) as e:
                 logger.warning("{}: {}".format(e.__class__.__name__, e))
         print()
         logger.info("Canceled\n")
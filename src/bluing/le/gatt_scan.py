@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import io
+import os
 import pickle
 import subprocess
 from subprocess import STDOUT
@@ -15,7 +16,7 @@ from bthci import ADDR_TYPE_PUBLIC
 from btgatt import Service, CharactValueDeclar, ServiceUuids, GattAttrTypes, bt_base_uuid, \
     GattClient, ReadCharactValueError, ReadCharactDescriptorError, CharactProperties
 
-from .. import BlueScanner, ScanResult
+from .. import BlueScanner, ScanResult, BLUETOOTHD_STORAGE_DIR
 from .ui import LOG_LEVEL
 from .gatt_scan_bt_agent import GattScanBtAgent
 
@@ -279,9 +280,19 @@ class GattScanResult(ScanResult):
 
 class GattScanner(BlueScanner):
     """"""
-    def __init__(self, iface: str = 'hci0', io_cap: str = 'NoInputNoOutput'):
+    def __init__(self, iface: str = 'hci0', io_cap: str = 'NoInputNoOutput', 
+                 keep_cache: bool = False):
+        """
+        keep_cache - Keep the data stored by bluetoothd for the scanned device, 
+                     e.g. pairing keys and the GATT cache.
+        """
         super().__init__(iface=iface)
         
+        # The cleanup in scan() needs the local BD_ADDR even when the scan 
+        # failed because of the controller, so it is read before any other 
+        # setup, e.g. registering the agent.
+        self.laddr = self.hci_bd_addr
+        self.keep_cache = keep_cache
         self.result = GattScanResult()
         self.gatt_client = None
         self.spinner = Halo(placement='right')
@@ -509,17 +520,15 @@ class GattScanner(BlueScanner):
             except subprocess.CalledProcessError:
                 pass
 
-            output = subprocess.check_output(
-                ' '.join(['sudo', 'systemctl', 'stop', 'bluetooth.service']), 
-                stderr=STDOUT, timeout=60, shell=True)
-
-            output = subprocess.check_output(
-                ' '.join(['sudo', 'rm', '-rf', '/var/lib/bluetooth/' + \
-                        self.hci_bd_addr + '/' + addr.upper()]), 
-                stderr=STDOUT, timeout=60, shell=True)
-
-            output = subprocess.check_output(
-                ' '.join(['sudo', 'systemctl', 'start', 'bluetooth.service']), 
-                stderr=STDOUT, timeout=60, shell=True)
+            if not self.keep_cache:
+                # Only restart bluetoothd when it has stored data of the device
+                dev_path = os.path.join(BLUETOOTHD_STORAGE_DIR, self.laddr, addr.upper())
+                subprocess.run(
+                    ['sudo', 'sh', '-c', 
+                     '[ -e {} ] || exit 0; '.format(dev_path) + ' && '.join([
+                        'systemctl stop bluetooth.service',
+                        'rm -rf ' + dev_path,
+                        'systemctl start bluetooth.service'])], 
+                    stdout=subprocess.DEVNULL, stderr=STDOUT, timeout=60, check=True)
         
         return self.result
@@ -6,7 +6,7 @@ Usage:
     bluing le [-i <hci>] [--scan-type=<type>] [--timeout=<sec>] [--sort=<key>] --scan
     bluing le [-i <hci>] --pairing-feature [--timeout=<sec>] [--addr-type=<type>] PEER_ADDR
     bluing le [-i <hci>] --ll-feature-set [--timeout=<sec>] [--addr-type=<type>] PEER_ADDR
-    bluing le [-i <hci>] --gatt [--io-cap=<name>] [--addr-type=<type>] PEER_ADDR
+    bluing le [-i <hci>] --gatt [--io-cap=<name>] [--addr-type=<type>] [--keep-cache] PEER_ADDR
     bluing le [-i <hci>] --local --gatt
     bluing le [-i <hci>] --mon-incoming-conn
     bluing le [--device=</dev/tty>] [--channel=<num>] --sniff-adv
@@ -28,6 +28,8 @@ Options:
     --io-cap=<name>       Set an IO Capability of the agent. Available value: 
                               DisplayOnly, DisplayYesNo, KeyboardOnly, NoInputNoOutput, 
                               KeyboardDisplay [default: NoInputNoOutput]
+    --keep-cache          Keep the data stored by bluetoothd for the remote device 
+                          after the GATT scan, instead of removing it
     --addr-type=<type>    Type of the LE address, public or random
     --sniff-adv           Sniff advertising physical channel PDU. Need at least 
                           one micro:bit (or other supported NRF51 device specified with --device)
@@ -47,7 +49,6 @@ from docopt import docopt
 from bthci import ADDR_TYPE_PUBLIC, ADDR_TYPE_RANDOM, HCI
 
 from . import LOG_LEVEL, PKG_NAME
-from .le_scan import LeScanner
 
 
 logger = Logger(__name__, LOG_LEVEL)
@@ -110,6 +111,7 @@ def parse_cmdline(argv: list[str] = sys.argv[1:]) -> dict:
             args['PEER_ADDR'] = args['PEER_ADDR'].upper()
 
             if args['--addr-type'] is None:
+                from .le_scan import LeScanner
                 logger.info("Automatically determining the address type of", blue(args['PEER_ADDR']))
                 
                 try: